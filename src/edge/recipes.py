@@ -11,16 +11,64 @@ Responsibilities:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import functools
+import hashlib
+import sys
+import threading
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import IntEnum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
 
 import json
 
+import numpy as np
+
 try:
-    import jsonschema  # type: ignore[import]
+    import orjson  # type: ignore[import]
 except Exception:  # pragma: no cover - optional dependency
-    jsonschema = None
+    orjson = None
+
+try:
+    import msgspec  # type: ignore[import]
+except Exception:  # pragma: no cover - optional dependency
+    msgspec = None
+
+# The schema-validation backends (fastjsonschema / jsonschema) are imported
+# lazily inside _get_validator: both pull in a non-trivial module tree, and
+# `from edge.recipes import load_recipe` with validate=False — the common
+# edge/test path — should not pay that cold-start cost.
+
+
+@functools.lru_cache(maxsize=1)
+def _get_fastjsonschema():
+    """Import fastjsonschema on first use; None when not installed."""
+    try:
+        import fastjsonschema  # type: ignore[import]
+
+        return fastjsonschema
+    except Exception:  # pragma: no cover - optional dependency
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _get_jsonschema():
+    """Import jsonschema on first use; None when not installed."""
+    try:
+        import jsonschema  # type: ignore[import]
+
+        return jsonschema
+    except Exception:  # pragma: no cover - optional dependency
+        return None
+
+# orjson's C/SIMD parser is several times faster than the stdlib json
+# module, which matters for the large schema.jsonc parsed on every
+# validated load. Optional: fall back to json.loads when absent.
+_json_loads = orjson.loads if orjson is not None else json.loads
 
 
 # --------------------------------------------------------------------
@@ -28,7 +76,20 @@ except Exception:  # pragma: no cover - optional dependency
 # --------------------------------------------------------------------
 
 
-@dataclass
+class BandShape(IntEnum):
+    """
+    Band-shape model, stored as an int for compact SoA packing.
+
+    Values match the shape codes in edge._qc_kernels (SHAPE_GAUSSIAN etc.)
+    so the QC pipeline can use them directly as dispatch indices.
+    """
+
+    GAUSSIAN = 0
+    PSEUDOVOIGT = 1
+    TEMPLATE = 2
+
+
+@dataclass(frozen=True, slots=True)
 class FitLims:
     """Optional physical constraints for peak fitting."""
 
@@ -38,12 +99,14 @@ class FitLims:
     sigma_max: Optional[float] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BandConfig:
     """
     Per-band thresholds and metadata.
 
     Matches a single entry in recipe['bands'] as defined in schema.jsonc.
+    Frozen + slotted: configs are immutable after load, and slots drop the
+    per-instance __dict__ (a recipe station keeps many of these alive).
     """
 
     name: str
@@ -58,16 +121,15 @@ class BandConfig:
     fit_lims: Optional[FitLims] = None
     notes: Optional[str] = None
 
-    # Band-shape model (all optional with safe defaults)
-    # "gaussian" | "pseudovoigt" | "template"
-    shape: str = "gaussian"
+    # Band-shape model; unknown shapes are rejected at load time
+    shape: BandShape = BandShape.GAUSSIAN
     # For pseudo-Voigt; ignored otherwise
     eta: Optional[float] = None
     # Optional fixed template for this band (same length as window)
     template: Optional[List[float]] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RecipeConfig:
     """
     Full recipe configuration: metadata, per-band thresholds, and global thresholds.
@@ -82,8 +144,31 @@ class RecipeConfig:
     kappa_min: float
     snr_min: float
     notes: Optional[str] = None
-    # keep original dict for debugging / logging
-    raw: Dict[str, Any] | None = None
+    # original dict for debugging / logging; only populated when loading
+    # with keep_raw=True (production loads save the duplicate heap). A
+    # read-only MappingProxyType view: the underlying dict is shared with
+    # the parsed-file cache, so mutation must raise rather than corrupt it.
+    raw: Mapping[str, Any] | None = None
+
+    # Structure-of-arrays views over `bands`, built once at load time so
+    # NumPy consumers (the QC pipeline precompute) can vectorize over all
+    # bands instead of looping in Python. Roles are coded via _ROLE_TO_CODE.
+    band_centers: Optional[np.ndarray] = field(default=None, compare=False, repr=False)
+    band_window_min: Optional[np.ndarray] = field(default=None, compare=False, repr=False)
+    band_window_max: Optional[np.ndarray] = field(default=None, compare=False, repr=False)
+    band_tol: Optional[np.ndarray] = field(default=None, compare=False, repr=False)
+    band_sigma: Optional[np.ndarray] = field(default=None, compare=False, repr=False)
+    band_roles: Optional[np.ndarray] = field(default=None, compare=False, repr=False)
+    band_shapes: Optional[np.ndarray] = field(default=None, compare=False, repr=False)
+
+
+# int8 role codes for RecipeConfig.band_roles
+_ROLE_TO_CODE: Dict[str, int] = {
+    "must-have": 0,
+    "must-not": 1,
+    "watch": 2,
+    "anchor": 3,
+}
 
 
 # --------------------------------------------------------------------
@@ -91,32 +176,114 @@ class RecipeConfig:
 # --------------------------------------------------------------------
 
 
-def _strip_jsonc_comments(text: str) -> str:
+def _strip_jsonc_comments(data: bytes) -> bytes:
     """
-    Very simple JSONC comment stripper.
+    Single-pass JSONC comment stripper over raw UTF-8 bytes.
 
     Removes:
     - line comments starting with //
     - block comments /* ... */
 
-    Assumes recipes do not contain these comment patterns inside string literals.
-    This keeps dependencies minimal; if that becomes an issue later, switch to a
-    proper JSONC/JSON5 parser.
+    Implemented as an O(n) scanner that jumps between the next interesting
+    delimiter (string quote, // or /*) with bytes.find, so comment markers
+    inside string literals (e.g. "https://...") are left intact — the old
+    two-pass regex approach corrupted those. Kept spans are copied into one
+    bytearray; operating on bytes skips the UTF-8 decode entirely (the
+    delimiters are ASCII, which never occurs inside multi-byte sequences)
+    and hands orjson/json the bytes they parse natively.
+    """
+    out = bytearray()
+    cursor = 0
+    n = len(data)
+
+    while cursor < n:
+        quote = data.find(b'"', cursor)
+        slash = data.find(b"/", cursor)
+
+        if slash == -1 and quote == -1:
+            out += data[cursor:]
+            break
+
+        # Next delimiter is a string: copy through its closing quote,
+        # honouring backslash escapes.
+        if slash == -1 or (quote != -1 and quote < slash):
+            end = quote + 1
+            while end < n:
+                b = data[end]
+                if b == 0x5C:  # backslash
+                    end += 2
+                    continue
+                if b == 0x22:  # closing quote
+                    end += 1
+                    break
+                end += 1
+            out += data[cursor:end]
+            cursor = end
+            continue
+
+        marker = data[slash : slash + 2]
+        if marker == b"//":
+            out += data[cursor:slash]
+            newline = data.find(b"\n", slash + 2)
+            cursor = n if newline == -1 else newline  # keep the newline
+        elif marker == b"/*":
+            out += data[cursor:slash]
+            close = data.find(b"*/", slash + 2)
+            cursor = n if close == -1 else close + 2
+        else:
+            # Lone slash (not a comment): copy it and move on.
+            out += data[cursor : slash + 1]
+            cursor = slash + 1
+
+    return bytes(out)
+
+
+# Parsed-file cache keyed by (path, mtime_ns, size): unchanged files skip the
+# read, the comment strip and the JSON parse on every reload (index reloads,
+# repeated test-suite loads, schema re-reads per recipe). Each entry stores
+# (parsed dict, blake2b digest of the cleaned bytes) — the digest keys the
+# validation-result memo below.
+_JSONC_CACHE: Dict[tuple, Tuple[Dict[str, Any], bytes]] = {}
+
+
+# Decoded-RecipeConfig cache for the msgspec fast path, keyed like
+# _JSONC_CACHE. RecipeConfig is frozen, so handing out the same instance
+# for an unchanged file is safe.
+_STRUCT_CACHE: Dict[tuple, "RecipeConfig"] = {}
+
+
+def clear_recipe_cache() -> None:
+    """Drop all cached parsed JSONC files (mainly for tests)."""
+    _JSONC_CACHE.clear()
+    _STRUCT_CACHE.clear()
+    with _VALIDATED_LOCK:
+        _VALIDATED.clear()
+
+
+def _load_jsonc_with_hash(path: Path) -> Tuple[Dict[str, Any], bytes]:
     """
-    import re
+    Load a JSONC file, returning (parsed dict, content digest).
 
-    # Remove /* ... */ (non-greedy, across lines)
-    text = re.sub(r"/\*.*?\*/", "", text, flags=re.DOTALL)
-    # Remove // ... end-of-line
-    text = re.sub(r"//.*?$", "", text, flags=re.MULTILINE)
-    return text
+    Results are cached per (path, mtime, size); callers must treat the
+    returned dict as read-only, as later loads of the same unchanged file
+    return the same object.
+    """
+    st = path.stat()
+    key = (str(path), st.st_mtime_ns, st.st_size)
+    hit = _JSONC_CACHE.get(key)
+    if hit is not None:
+        return hit
+
+    clean = _strip_jsonc_comments(path.read_bytes())
+    parsed = _json_loads(clean)
+    digest = hashlib.blake2b(clean, digest_size=16).digest()
+    _JSONC_CACHE[key] = (parsed, digest)
+    return parsed, digest
 
 
 def _load_jsonc(path: Path) -> Dict[str, Any]:
-    """Load a JSONC file by stripping comments first."""
-    text = path.read_text(encoding="utf-8")
-    clean = _strip_jsonc_comments(text)
-    return json.loads(clean)
+    """Load a JSONC file by stripping comments first (cached)."""
+    return _load_jsonc_with_hash(path)[0]
 
 
 # --------------------------------------------------------------------
@@ -129,20 +296,144 @@ def _load_schema(schema_path: Path) -> Dict[str, Any]:
     return _load_jsonc(schema_path)
 
 
-def _validate_recipe_dict(data: Dict[str, Any], schema: Dict[str, Any]) -> None:
+class _FastValidator:
+    """
+    Adapter giving a fastjsonschema-compiled function the small validator
+    surface the loaders use (validate / iter_errors).
+
+    fastjsonschema code-generates a Python function specialized to the
+    schema, roughly an order of magnitude faster than the generic
+    jsonschema tree walk. It stops at the first error, so iter_errors
+    yields at most one entry; error messages also differ slightly from
+    jsonschema's.
     """
-    Validate a recipe dictionary against the schema, if jsonschema is available.
+
+    __slots__ = ("_fn", "_error_cls")
+
+    def __init__(self, schema: Dict[str, Any]):
+        fjs = _get_fastjsonschema()
+        self._fn = fjs.compile(schema)
+        self._error_cls = fjs.JsonSchemaException
+
+    def validate(self, data: Dict[str, Any]) -> None:
+        self._fn(data)
+
+    def iter_errors(self, data: Dict[str, Any]):
+        try:
+            self._fn(data)
+        except self._error_cls as exc:
+            yield exc
+
+
+@functools.lru_cache(maxsize=8)
+def _get_validator(schema_path_str: str):
+    """
+    Build (once per schema path) a pre-compiled schema validator.
+
+    Prefers fastjsonschema (schema-specialized codegen) and falls back to
+    a jsonschema Draft202012Validator. Either way the schema is compiled
+    once and reused: jsonschema.validate re-compiles on every call, an
+    O(n_recipes x |schema|) tax when loading a whole index.
 
     Raises:
-        jsonschema.ValidationError if the recipe is invalid.
-        RuntimeError if jsonschema is not installed and validation is requested.
+        RuntimeError if neither backend is installed and validation is
+        requested.
     """
+    schema = _load_schema(Path(schema_path_str))
+
+    if _get_fastjsonschema() is not None:
+        return _FastValidator(schema)
+
+    jsonschema = _get_jsonschema()
     if jsonschema is None:
         raise RuntimeError(
-            "jsonschema is not installed, cannot validate recipe. "
-            "Install with `pip install jsonschema` or disable strict validation."
+            "Neither fastjsonschema nor jsonschema is installed, cannot "
+            "validate recipe. Install one of them or disable strict validation."
         )
-    jsonschema.validate(instance=data, schema=schema)
+    validator_cls = jsonschema.Draft202012Validator
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
+
+# Validation-result memo: (id(validator), content digest) -> validator for
+# documents that already passed validation. The value pins the validator
+# and lets hits verify identity, since lru_cache eviction can recycle an
+# id(). LRU-capped; the lock only guards writes — lookups race harmlessly
+# (worst case a redundant validation).
+_VALIDATED: "OrderedDict[Tuple[int, bytes], Any]" = OrderedDict()
+_VALIDATED_MAX = 256
+_VALIDATED_LOCK = threading.Lock()
+
+
+def _validated_hit(key: Optional[Tuple[int, bytes]], validator) -> bool:
+    """
+    True if this (validator, digest) pair is already in the memo.
+
+    The stored validator is compared by identity: _get_validator's
+    lru_cache can evict, and a new validator allocated at a recycled id()
+    must never inherit another schema's memo entries (same hazard as the
+    precomp cache in qc_pipeline).
+    """
+    return key is not None and _VALIDATED.get(key) is validator
+
+
+def _validated_add(key: Optional[Tuple[int, bytes]], validator) -> None:
+    """Record a clean (validator, digest) pair, LRU-capping the memo."""
+    if key is None:
+        return
+    with _VALIDATED_LOCK:
+        _VALIDATED[key] = validator
+        while len(_VALIDATED) > _VALIDATED_MAX:
+            _VALIDATED.popitem(last=False)
+
+
+def _validate_recipe_dict(
+    data: Dict[str, Any], validator, digest: Optional[bytes] = None
+) -> None:
+    """
+    Validate a recipe dictionary with a pre-compiled validator.
+
+    When the content digest of the document is known, previously validated
+    documents skip the schema walk entirely via the _VALIDATED memo.
+
+    Raises:
+        jsonschema.ValidationError if the recipe is invalid.
+    """
+    key = (id(validator), digest) if digest is not None else None
+    if _validated_hit(key, validator):
+        return
+
+    validator.validate(data)
+    _validated_add(key, validator)
+
+
+def _validate_many(
+    docs: Iterable[Tuple[str, Dict[str, Any], Optional[bytes]]], validator
+) -> List[Tuple[str, list]]:
+    """
+    Validate several recipe dicts with one pre-compiled validator.
+
+    Uses validator.iter_errors rather than validator.validate, so invalid
+    recipes do not pay exception construction/unwind cost per document and
+    the caller sees every failure at once instead of just the first.
+    Documents whose content digest is already in the _VALIDATED memo are
+    skipped; clean documents are added to it.
+
+    Returns:
+        [(name, errors)] for each doc that produced at least one error.
+    """
+    failures: List[Tuple[str, list]] = []
+    vid = id(validator)
+    for name, doc, digest in docs:
+        key = (vid, digest) if digest is not None else None
+        if _validated_hit(key, validator):
+            continue
+        errors = list(validator.iter_errors(doc))
+        if errors:
+            failures.append((name, errors))
+        else:
+            _validated_add(key, validator)
+    return failures
 
 
 # --------------------------------------------------------------------
@@ -150,35 +441,54 @@ def _validate_recipe_dict(data: Dict[str, Any], schema: Dict[str, Any]) -> None:
 # --------------------------------------------------------------------
 
 
+# Precomputed role normalization ("must_have" → "must-have" etc.): a dict
+# hit is one hash lookup instead of a str.replace scan-and-allocate per
+# band, and the values are interned so every BandConfig.role shares
+# storage and compares by pointer downstream.
+_ROLE_MAP: Dict[str, str] = {
+    raw: sys.intern(canon)
+    for canon in ("must-have", "must-not", "watch", "anchor")
+    for raw in (canon, canon.replace("-", "_"))
+}
+
+
 def _band_from_dict(entry: Dict[str, Any]) -> BandConfig:
     """Convert a single band dictionary into a BandConfig."""
-    window = entry.get("window_range", {})
-    fit_lims_raw = entry.get("fit_lims")
+    # Bound once: this runs N_recipes x N_bands times during bulk loads,
+    # where repeated dict-method and global lookups add up.
+    get = entry.get
+    window = get("window_range", {})
+    fit_lims_raw = get("fit_lims")
 
     fit_lims = None
     if isinstance(fit_lims_raw, dict):
+        fl_get = fit_lims_raw.get
         fit_lims = FitLims(
-            amp_min=fit_lims_raw.get("amp_min"),
-            amp_max=fit_lims_raw.get("amp_max"),
-            sigma_min=fit_lims_raw.get("sigma_min"),
-            sigma_max=fit_lims_raw.get("sigma_max"),
+            amp_min=fl_get("amp_min"),
+            amp_max=fl_get("amp_max"),
+            sigma_min=fl_get("sigma_min"),
+            sigma_max=fl_get("sigma_max"),
         )
 
     # Normalise role for backwards-compatibility:
     #   "must_have" → "must-have"
     #   "must_not"  → "must-not"
-    raw_role = str(entry["role"])
-    role = raw_role.replace("_", "-")
-
-    # Normalise / validate shape
-    raw_shape = str(entry.get("shape", "gaussian")).lower()
-    if raw_shape not in {"gaussian", "pseudovoigt", "template"}:
-        shape = "gaussian"
-    else:
-        shape = raw_shape
-
-    eta = entry.get("eta")
-    template = entry.get("template")
+    raw_role = entry["role"]
+    role = _ROLE_MAP.get(raw_role) or sys.intern(str(raw_role).replace("_", "-"))
+
+    # Resolve shape, rejecting unknown values loudly: a silent gaussian
+    # fallback would mask recipe typos all the way into QC decisions.
+    raw_shape = str(get("shape", "gaussian"))
+    try:
+        shape = BandShape[raw_shape.upper()]
+    except KeyError:
+        raise ValueError(
+            f"band {entry.get('name')!r}: unknown shape {raw_shape!r} "
+            f"(expected one of {[s.name.lower() for s in BandShape]})"
+        ) from None
+
+    eta = get("eta")
+    template = get("template")
 
     return BandConfig(
         name=entry["name"],
@@ -189,29 +499,169 @@ def _band_from_dict(entry: Dict[str, Any]) -> BandConfig:
         window_min=float(window["min"]),
         window_max=float(window["max"]),
         fit_lims=fit_lims,
-        notes=entry.get("notes"),
+        notes=get("notes"),
         shape=shape,
         eta=float(eta) if eta is not None else None,
         template=list(template) if isinstance(template, list) else None,
     )
 
 
-def _recipe_from_dict(data: Dict[str, Any]) -> RecipeConfig:
-    """Convert a validated recipe dictionary into a RecipeConfig dataclass."""
+def _band_soa(bands: List[BandConfig]) -> Dict[str, np.ndarray]:
+    """
+    Build the structure-of-arrays RecipeConfig fields for a band list.
+
+    Window bounds stay float64 so downstream binary searches land on
+    exactly the same grid indices as the scalar BandConfig fields.
+    """
+    n = len(bands)
+    return {
+        "band_centers": np.fromiter(
+            (b.center for b in bands), dtype=np.float64, count=n
+        ),
+        "band_window_min": np.fromiter(
+            (b.window_min for b in bands), dtype=np.float64, count=n
+        ),
+        "band_window_max": np.fromiter(
+            (b.window_max for b in bands), dtype=np.float64, count=n
+        ),
+        "band_tol": np.fromiter((b.tol for b in bands), dtype=np.float64, count=n),
+        "band_sigma": np.fromiter((b.sigma for b in bands), dtype=np.float64, count=n),
+        "band_roles": np.fromiter(
+            (_ROLE_TO_CODE.get(b.role, _ROLE_TO_CODE["watch"]) for b in bands),
+            dtype=np.int8,
+            count=n,
+        ),
+        "band_shapes": np.fromiter(
+            (b.shape for b in bands), dtype=np.int8, count=n
+        ),
+    }
+
+
+def _recipe_from_dict(data: Dict[str, Any], keep_raw: bool = False) -> RecipeConfig:
+    """
+    Convert a validated recipe dictionary into a RecipeConfig dataclass.
+
+    keep_raw=True retains the parsed dict on RecipeConfig.raw for
+    debugging; the default drops it so the typed config is the only
+    live copy.
+    """
     bands_raw = data.get("bands", [])
     bands = [_band_from_dict(b) for b in bands_raw]
 
     return RecipeConfig(
+        **_band_soa(bands),
         recipe_name=data["recipe_name"],
         recipe_version=data["recipe_version"],
-        station=data["station"],
+        station=sys.intern(str(data["station"])),
         bands=bands,
         epsilon=float(data["epsilon"]),
         tau=float(data["tau"]),
         kappa_min=float(data["kappa_min"]),
         snr_min=float(data["snr_min"]),
         notes=data.get("notes"),
-        raw=data,
+        raw=MappingProxyType(data) if keep_raw else None,
+    )
+
+
+# --------------------------------------------------------------------
+# msgspec fast path: decode cleaned JSONC bytes straight into typed
+# structs, skipping the intermediate dict tree. Optional; when msgspec is
+# absent the json.loads → _recipe_from_dict path above is used.
+# --------------------------------------------------------------------
+
+if msgspec is not None:
+
+    class _WindowStruct(msgspec.Struct):
+        min: float
+        max: float
+
+    class _FitLimsStruct(msgspec.Struct):
+        amp_min: Optional[float] = None
+        amp_max: Optional[float] = None
+        sigma_min: Optional[float] = None
+        sigma_max: Optional[float] = None
+
+    class _BandStruct(msgspec.Struct, kw_only=True):
+        name: str
+        center: float
+        tol: float
+        sigma: float
+        role: str
+        window_range: _WindowStruct
+        fit_lims: Optional[_FitLimsStruct] = None
+        notes: Optional[str] = None
+        shape: str = "gaussian"
+        eta: Optional[float] = None
+        template: Optional[List[float]] = None
+
+    class _RecipeStruct(msgspec.Struct, kw_only=True):
+        recipe_name: str
+        recipe_version: str
+        station: str
+        bands: List[_BandStruct]
+        epsilon: float
+        tau: float
+        kappa_min: float
+        snr_min: float
+        notes: Optional[str] = None
+
+    _RECIPE_DECODER = msgspec.json.Decoder(_RecipeStruct)
+else:  # pragma: no cover - msgspec installed in production images
+    _RECIPE_DECODER = None
+
+
+def _recipe_from_bytes(clean: bytes) -> RecipeConfig:
+    """
+    Decode cleaned JSONC bytes into a RecipeConfig via msgspec.
+
+    One C-level pass produces the typed struct tree directly; the cheap
+    Python post-process below only normalizes role/shape and builds the
+    frozen dataclasses + SoA arrays.
+    """
+    rs = _RECIPE_DECODER.decode(clean)
+
+    bands: List[BandConfig] = []
+    for bs in rs.bands:
+        fl = bs.fit_lims
+        try:
+            shape = BandShape[bs.shape.upper()]
+        except KeyError:
+            raise ValueError(
+                f"band {bs.name!r}: unknown shape {bs.shape!r} "
+                f"(expected one of {[s.name.lower() for s in BandShape]})"
+            ) from None
+        bands.append(
+            BandConfig(
+                name=bs.name,
+                center=bs.center,
+                tol=bs.tol,
+                sigma=bs.sigma,
+                role=_ROLE_MAP.get(bs.role)
+                or sys.intern(bs.role.replace("_", "-")),
+                window_min=bs.window_range.min,
+                window_max=bs.window_range.max,
+                fit_lims=FitLims(fl.amp_min, fl.amp_max, fl.sigma_min, fl.sigma_max)
+                if fl is not None
+                else None,
+                notes=bs.notes,
+                shape=shape,
+                eta=bs.eta,
+                template=bs.template,
+            )
+        )
+
+    return RecipeConfig(
+        **_band_soa(bands),
+        recipe_name=rs.recipe_name,
+        recipe_version=rs.recipe_version,
+        station=sys.intern(rs.station),
+        bands=bands,
+        epsilon=rs.epsilon,
+        tau=rs.tau,
+        kappa_min=rs.kappa_min,
+        snr_min=rs.snr_min,
+        notes=rs.notes,
+        raw=None,
     )
 
 
@@ -220,10 +670,42 @@ def _recipe_from_dict(data: Dict[str, Any]) -> RecipeConfig:
 # --------------------------------------------------------------------
 
 
+def _load_recipe_prepared(
+    recipe_path: Path,
+    validator=None,
+    keep_raw: bool = False,
+) -> RecipeConfig:
+    """
+    Load one recipe with schema defaulting already resolved by the caller.
+
+    Inner layer of the two-layer load API: takes an already-built validator
+    (or None to skip validation) so callers loading many recipes resolve
+    the schema path and compile the validator once, outside their loop.
+    """
+    # Fused parse+construct fast path: no schema walk or raw dict needed,
+    # so decode the cleaned bytes straight into typed objects. Cached per
+    # (path, mtime, size) like _load_jsonc, so repeated loads of an
+    # unchanged file skip the read and decode too.
+    if _RECIPE_DECODER is not None and validator is None and not keep_raw:
+        st = recipe_path.stat()
+        key = (str(recipe_path), st.st_mtime_ns, st.st_size)
+        cfg = _STRUCT_CACHE.get(key)
+        if cfg is None:
+            cfg = _recipe_from_bytes(_strip_jsonc_comments(recipe_path.read_bytes()))
+            _STRUCT_CACHE[key] = cfg
+        return cfg
+
+    recipe_dict, digest = _load_jsonc_with_hash(recipe_path)
+    if validator is not None:
+        _validate_recipe_dict(recipe_dict, validator, digest=digest)
+    return _recipe_from_dict(recipe_dict, keep_raw=keep_raw)
+
+
 def load_recipe(
     recipe_path: Path,
     schema_path: Optional[Path] = None,
     validate: bool = True,
+    keep_raw: bool = False,
 ) -> RecipeConfig:
     """
     Load a single QC recipe from a JSONC file.
@@ -233,6 +715,7 @@ def load_recipe(
         schema_path: Path to schema.jsonc. If None, defaults to
                      recipe_path.parent / 'schema.jsonc'.
         validate: If True, validate the recipe against the schema using jsonschema.
+        keep_raw: If True, keep the parsed dict on RecipeConfig.raw (debugging).
 
     Returns:
         RecipeConfig dataclass instance.
@@ -240,19 +723,15 @@ def load_recipe(
     if schema_path is None:
         schema_path = recipe_path.parent / "schema.jsonc"
 
-    recipe_dict = _load_jsonc(recipe_path)
-
-    if validate:
-        schema_dict = _load_schema(schema_path)
-        _validate_recipe_dict(recipe_dict, schema_dict)
-
-    return _recipe_from_dict(recipe_dict)
+    validator = _get_validator(str(schema_path)) if validate else None
+    return _load_recipe_prepared(recipe_path, validator, keep_raw=keep_raw)
 
 
 def load_recipes_from_index(
     index_path: Path,
     schema_path: Optional[Path] = None,
     validate: bool = True,
+    keep_raw: bool = False,
 ) -> Dict[str, RecipeConfig]:
     """
     Load all recipes listed in an index.jsonc file.
@@ -285,15 +764,91 @@ def load_recipes_from_index(
     else:
         mapping = index_dict
 
-    recipes: Dict[str, RecipeConfig] = {}
+    # Load every recipe dict first, then batch-validate with a single
+    # pre-compiled validator: one schema compile for the whole index, and
+    # all invalid recipes reported together instead of failing one by one.
+    docs: List[Tuple[str, Dict[str, Any], bytes]] = []
     for name, rel_path in mapping.items():
-        recipe_file = base_dir / rel_path
-        cfg = load_recipe(recipe_file, schema_path=schema_path, validate=validate)
-        recipes[name] = cfg
+        recipe_dict, digest = _load_jsonc_with_hash(base_dir / rel_path)
+        docs.append((name, recipe_dict, digest))
+
+    if validate:
+        validator = _get_validator(str(schema_path))
+        failures = _validate_many(docs, validator)
+        if failures:
+            details = "; ".join(
+                f"{name}: {errors[0].message}" for name, errors in failures
+            )
+            raise ValueError(
+                f"{len(failures)} invalid recipe(s) in {index_path}: {details}"
+            )
+
+    recipes: Dict[str, RecipeConfig] = {}
+    for name, recipe_dict, _digest in docs:
+        recipes[name] = _recipe_from_dict(recipe_dict, keep_raw=keep_raw)
 
     return recipes
 
 
+def load_recipes_from_index_concurrent(
+    index_path: Path,
+    schema_path: Optional[Path] = None,
+    validate: bool = True,
+    keep_raw: bool = False,
+) -> Dict[str, RecipeConfig]:
+    """
+    Concurrent variant of load_recipes_from_index.
+
+    Per-recipe work (read_bytes, comment strip, parse, validate) is
+    independent and dominated by syscall + C-level parse time that
+    releases the GIL, so it fans out to a thread pool. Indices with at
+    most two recipes skip the executor entirely and take the serial path.
+
+    Validation failures raise per recipe as in load_recipe, not combined
+    as in the serial bulk loader.
+    """
+    if schema_path is None:
+        schema_path = index_path.parent / "schema.jsonc"
+
+    index_dict = _load_jsonc(index_path)
+    base_dir = index_path.parent
+
+    if (
+        isinstance(index_dict, dict)
+        and "current" in index_dict
+        and isinstance(index_dict["current"], dict)
+    ):
+        mapping = index_dict["current"]
+    else:
+        mapping = index_dict
+
+    if len(mapping) <= 2:
+        return load_recipes_from_index(
+            index_path, schema_path=schema_path, validate=validate, keep_raw=keep_raw
+        )
+
+    validator = _get_validator(str(schema_path)) if validate else None
+
+    names = list(mapping)
+    with ThreadPoolExecutor(max_workers=min(8, len(names))) as ex:
+        configs = ex.map(
+            lambda name: _load_recipe_prepared(
+                base_dir / mapping[name], validator, keep_raw=keep_raw
+            ),
+            names,
+        )
+        # ex.map preserves input order, so the dict keeps index order.
+        return dict(zip(names, configs))
+
+
+# Precompiled row templates for format_recipe: positional fields avoid the
+# per-row kwargs dict that keyword .format() calls construct.
+_BAND_HEADER_ROW = "    {:<14} {:>7} {:>7} {:>7} {:<10} {:<10} {}".format(
+    "name", "center", "tol", "sigma", "role", "shape", "window"
+)
+_BAND_ROW_FMT = "    {:<14} {:>7.1f} {:>7.1f} {:>7.1f} {:<10} {:<10} [{:.1f}, {:.1f}]"
+
+
 def format_recipe(recipe: RecipeConfig) -> str:
     """
     Return a human-readable summary of a recipe, suitable for CLI logs or debug.
@@ -327,31 +882,22 @@ def format_recipe(recipe: RecipeConfig) -> str:
 
     lines.append("")
     lines.append("  Bands:")
-    lines.append(
-        "    {name:<14} {center:>7} {tol:>7} {sigma:>7} {role:<10} {shape:<10} {window}".format(
-            name="name",
-            center="center",
-            tol="tol",
-            sigma="sigma",
-            role="role",
-            shape="shape",
-            window="window",
-        )
-    )
+    lines.append(_BAND_HEADER_ROW)
     lines.append("    " + "-" * 80)
 
-    for b in recipe.bands:
-        window_str = f"[{b.window_min:.1f}, {b.window_max:.1f}]"
-        lines.append(
-            "    {name:<14} {center:>7.1f} {tol:>7.1f} {sigma:>7.1f} {role:<10} {shape:<10} {window}".format(
-                name=b.name[:14],
-                center=b.center,
-                tol=b.tol,
-                sigma=b.sigma,
-                role=b.role,
-                shape=b.shape,
-                window=window_str,
-            )
+    fmt = _BAND_ROW_FMT.format
+    lines.extend(
+        fmt(
+            b.name[:14],
+            b.center,
+            b.tol,
+            b.sigma,
+            b.role,
+            b.shape.name.lower(),
+            b.window_min,
+            b.window_max,
         )
+        for b in recipe.bands
+    )
 
     return "\n".join(lines)
\ No newline at end of file
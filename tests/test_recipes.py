@@ -7,18 +7,53 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+import json
+
+import pytest
+
 from src.edge.recipes import (
     load_recipe,
     load_recipes_from_index,
     RecipeConfig,
     BandConfig,
 )
-from src.edge.recipes import format_recipe
+from src.edge.recipes import (
+    clear_recipe_cache,
+    format_recipe,
+    load_recipes_from_index_concurrent,
+    _load_jsonc,
+    _strip_jsonc_comments,
+)
 
 REPO_ROOT = ROOT
 RECIPES_DIR = REPO_ROOT / "recipes"
 
 
+def test_strip_jsonc_comments_preserves_string_literals():
+    """
+    Comment markers inside string literals must survive stripping
+    (regression: the old regex stripper truncated "https://..." values),
+    while real // and /* */ comments are removed.
+    """
+    src = b"""{
+      // line comment
+      "url": "https://example.org/path", /* block
+         comment */
+      "slash": "a\\"b//c",
+      "ratio": "1/2"
+    }"""
+    data = json.loads(_strip_jsonc_comments(src))
+    assert data["url"] == "https://example.org/path"
+    assert data["slash"] == 'a"b//c'
+    assert data["ratio"] == "1/2"
+
+
+def test_schema_jsonc_loads_with_url_intact():
+    """schema.jsonc's $schema URL contains '//' and must load unharmed."""
+    schema = _load_jsonc(RECIPES_DIR / "schema.jsonc")
+    assert schema["$schema"].startswith("https://json-schema.org/")
+
+
 def test_load_cathode_lfp_recipe():
     path = RECIPES_DIR / "cathode_lfp_qc.jsonc"
     cfg = load_recipe(path, validate=False)
@@ -84,6 +119,79 @@ def test_load_all_recipes_from_index():
         assert len(cfg.bands) > 0
 
 
+def test_keep_raw_opt_in_returns_read_only_view():
+    """
+    Production loads drop the parsed dict (raw is None); keep_raw=True
+    retains it as a read-only view, so mutating it raises instead of
+    corrupting the shared parse cache.
+    """
+    path = RECIPES_DIR / "electrolyte_qc.jsonc"
+
+    assert load_recipe(path, validate=False).raw is None
+
+    cfg = load_recipe(path, validate=False, keep_raw=True)
+    assert cfg.raw is not None
+    assert cfg.raw["recipe_name"] == "electrolyte_qc"
+    with pytest.raises(TypeError):
+        cfg.raw["recipe_name"] = "tampered"
+
+
+def test_unknown_band_shape_raises_in_both_decode_paths():
+    """
+    Unknown shape strings must raise ValueError at load time (no silent
+    gaussian fallback) — from the dict converter and, when msgspec is
+    installed, from the struct fast path as well.
+    """
+    from src.edge.recipes import _band_from_dict, _RECIPE_DECODER
+
+    bad_band = {
+        "name": "X",
+        "center": 100.0,
+        "tol": 5.0,
+        "sigma": 2.0,
+        "role": "watch",
+        "window_range": {"min": 90.0, "max": 110.0},
+        "shape": "lorentz",
+    }
+
+    with pytest.raises(ValueError, match="unknown shape 'lorentz'"):
+        _band_from_dict(bad_band)
+
+    if _RECIPE_DECODER is not None:
+        from src.edge.recipes import _recipe_from_bytes
+
+        recipe = {
+            "recipe_name": "t",
+            "recipe_version": "0.0.1",
+            "station": "A1",
+            "epsilon": 0.1,
+            "tau": 0.5,
+            "kappa_min": 0.5,
+            "snr_min": 1.0,
+            "bands": [bad_band],
+        }
+        with pytest.raises(ValueError, match="unknown shape 'lorentz'"):
+            _recipe_from_bytes(json.dumps(recipe).encode())
+
+
+def test_concurrent_index_load_matches_serial():
+    """
+    load_recipes_from_index_concurrent must return the same recipes in
+    the same (index) order as the serial loader, including from a cold
+    cache.
+    """
+    index_path = RECIPES_DIR / "index.jsonc"
+    serial = load_recipes_from_index(index_path, validate=False)
+
+    clear_recipe_cache()
+    concurrent = load_recipes_from_index_concurrent(index_path, validate=False)
+
+    assert list(concurrent) == list(serial)
+    for name in serial:
+        assert concurrent[name].bands == serial[name].bands
+        assert concurrent[name].recipe_version == serial[name].recipe_version
+
+
 def test_numeric_constraints_all_recipes():
     """
     Numeric sanity checks for all recipes listed in index.jsonc.
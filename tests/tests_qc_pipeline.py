@@ -20,6 +20,7 @@ if str(SRC) not in sys.path:
 from typing import Dict
 
 import numpy as np
+import pytest
 
 from edge.qc_pipeline import (
     Classifier,
@@ -271,4 +272,325 @@ def test_qsvm_backend_uses_kappa_for_ood_and_triggers_red():
     sample_result = run_qc_on_spectrum(nu, intensity, recipe, clf)
     # must-have + OOD -> RED
     assert sample_result.decision == "RED"
-    assert any("OOD" in br.label.value for br in sample_result.bands)
\ No newline at end of file
+    assert any("OOD" in br.label.name for br in sample_result.bands)
+
+
+class CountingQsvmClient(FakeQsvmClient):
+    """FakeQsvmClient that counts predict calls (for cache tests)."""
+
+    def __init__(self, responses):
+        super().__init__(responses)
+        self.calls = 0
+
+    def predict(self, payload):
+        self.calls += 1
+        return super().predict(payload)
+
+
+def test_qsvm_prediction_cache_hit_and_miss():
+    """
+    Repeated QSVM predictions for the same (band, features) must be served
+    from the classifier's LRU cache; different features must go back to
+    the client.
+    """
+    band = make_simple_band(name="PF6")
+    client = CountingQsvmClient({"PF6": {"confidence": 0.9, "kappa": 0.7}})
+    clf = Classifier(method="qsvm", model="m", client=client)
+
+    features = np.linspace(0.0, 1.0, 32, dtype=np.float32)
+
+    first = clf.predict(features, band)
+    second = clf.predict(features, band)
+    assert first == second == (0.9, 0.7)
+    assert client.calls == 1  # second call was a cache hit
+
+    clf.predict(features + 1.0, band)
+    assert client.calls == 2  # new features -> cache miss
+
+
+class BatchQsvmClient:
+    """Fake QSVM client with batch support, capturing the wire payloads."""
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.payloads = []
+
+    def predict_batch(self, payload):
+        self.payloads.append(payload)
+        return [self.responses[item["band"]] for item in payload["items"]]
+
+
+def test_qsvm_predict_batch_payload_contract():
+    """
+    Batch-capable clients get one predict_batch call per spectrum with a
+    {"model_id", "items": [{"band", "features_b64", "dtype", "shape"}]}
+    payload, results come back in band order, and cached bands are left
+    out of subsequent payloads.
+    """
+    bands = [make_simple_band(name="PF6"), make_simple_band(name="Li2CO3")]
+    client = BatchQsvmClient(
+        {
+            "PF6": {"confidence": 0.9, "kappa": 0.8},
+            "Li2CO3": {"confidence": 0.4, "kappa": 0.6},
+        }
+    )
+    clf = Classifier(method="qsvm", model="m", client=client)
+
+    features_list = [
+        np.linspace(0.0, 1.0, 32, dtype=np.float32),
+        np.linspace(1.0, 2.0, 32, dtype=np.float32),
+    ]
+
+    results = clf.predict_batch(features_list, bands)
+    assert results == [(0.9, 0.8), (0.4, 0.6)]
+    assert len(client.payloads) == 1
+    payload = client.payloads[0]
+    assert payload["model_id"] == "m"
+    assert [item["band"] for item in payload["items"]] == ["PF6", "Li2CO3"]
+    for item in payload["items"]:
+        assert item["dtype"] == "f4"
+        assert item["shape"] == [32]
+        assert isinstance(item["features_b64"], str)
+
+    # Same spectrum again: everything is cached, no new round-trip.
+    assert clf.predict_batch(features_list, bands) == results
+    assert len(client.payloads) == 1
+
+    # One changed band: only the miss goes over the wire.
+    features_list[1] = features_list[1] + 1.0
+    clf.predict_batch(features_list, bands)
+    assert len(client.payloads) == 2
+    assert [item["band"] for item in client.payloads[1]["items"]] == ["Li2CO3"]
+
+
+def test_batched_metrics_match_scalar_helpers():
+    """
+    _compute_metrics_batch must reproduce the scalar per-band helpers
+    (center, SNR, RMSE) on randomized spectra — the batch path is a pure
+    layout optimization, not a semantic change.
+    """
+    from edge.qc_pipeline import (
+        _compute_metrics_batch,
+        _compute_rmse,
+        _compute_snr,
+        _estimate_center,
+        _extract_window,
+        _get_precomp,
+    )
+
+    bands = [
+        make_simple_band(name="A", center=5.0, sigma=1.0, window_min=3.0, window_max=7.0),
+        make_simple_band(name="B", center=12.0, sigma=2.0, window_min=8.0, window_max=16.0),
+        make_simple_band(name="C", center=18.0, sigma=0.5, window_min=17.0, window_max=19.0),
+    ]
+    recipe = make_simple_recipe(bands=bands)
+    nu = np.linspace(0.0, 20.0, 401)
+    rng = np.random.default_rng(3)
+
+    for _ in range(5):
+        intensity = 0.1 * rng.standard_normal(nu.size)
+        for b in bands:
+            intensity += rng.uniform(0.5, 2.0) * np.exp(
+                -0.5 * ((nu - b.center) / b.sigma) ** 2
+            )
+
+        precomp = _get_precomp(recipe, nu)
+        center, snr, rmse, _ = _compute_metrics_batch(intensity, recipe, precomp)
+        for i, band in enumerate(bands):
+            w_nu, w_I = _extract_window(nu, intensity, band)
+            assert center[i] == pytest.approx(_estimate_center(w_nu, w_I))
+            assert snr[i] == pytest.approx(_compute_snr(w_I), rel=1e-9)
+            assert rmse[i] == pytest.approx(
+                _compute_rmse(w_nu, w_I, band), rel=1e-6
+            )
+
+
+def test_empty_band_window_no_warning():
+    """
+    A band whose window lies outside the grid must degrade quietly —
+    same (NaN center, snr 0, rmse 1) outputs as the scalar early return,
+    and no all-NaN-slice RuntimeWarning from the nan-reductions.
+    """
+    import warnings
+
+    from edge.qc_pipeline import _compute_metrics_batch, _get_precomp
+
+    recipe = make_simple_recipe(
+        bands=[
+            make_simple_band(name="InGrid"),
+            make_simple_band(name="OffGrid", center=55.0, window_min=50.0, window_max=60.0),
+        ]
+    )
+    nu = np.linspace(0.0, 20.0, 201)
+    intensity = np.zeros_like(nu)
+    intensity[100] = 1.0
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        center, snr, rmse, ctx = _compute_metrics_batch(
+            intensity, recipe, _get_precomp(recipe, nu), nu=nu
+        )
+
+    assert np.isnan(center[1])
+    assert snr[1] == 0.0
+    assert rmse[1] == 1.0
+    assert ctx[1].size == 0
+
+
+def test_unsorted_nu_axis_rejected():
+    """
+    Window extraction binary-searches the nu axis, so an unsorted axis
+    must raise instead of silently producing wrong windows.
+    """
+    recipe = make_simple_recipe()
+    clf = Classifier(method="dummy")
+
+    nu = np.array([3.0, 1.0, 2.0])
+    with pytest.raises(ValueError, match="monotonically increasing"):
+        run_qc_on_spectrum(nu, np.zeros_like(nu), recipe, clf)
+
+
+def test_spectrum_overlapping_no_band_window():
+    """
+    A spectrum whose axis overlaps no band window at all (every padded
+    row empty, W_max == 0) must degrade like the scalar path instead of
+    crashing — regression: the all-NaN-row guard indexed column 0 of a
+    (B, 0) matrix.
+    """
+    recipe = make_simple_recipe()
+    clf = Classifier(method="dummy")
+
+    result = run_qc_on_spectrum(np.array([100.0]), np.array([1.0]), recipe, clf)
+    assert result.decision == "RED"
+    assert np.isnan(result.bands[0].metrics.center_obs)
+    assert result.bands[0].metrics.snr == 0.0
+    assert result.bands[0].metrics.rmse == 1.0
+
+    # Empty spectrum: same degenerate outputs.
+    result = run_qc_on_spectrum(np.array([]), np.array([]), recipe, clf)
+    assert result.decision == "RED"
+    assert np.isnan(result.bands[0].metrics.center_obs)
+
+
+def test_metrics_kernel_matches_scalar_helpers():
+    """
+    The fused _qc_kernels._metrics_nb kernel must reproduce the scalar
+    helpers exactly, including the fit_lims amplitude clamp (passed as
+    explicit value + flag pairs, not NaN sentinels). Runs in pure Python
+    when numba is absent (the no-op njit fallback) and compiled when it
+    is installed.
+    """
+    from edge._qc_kernels import SHAPE_GAUSSIAN, _metrics_nb
+    from edge.qc_pipeline import (
+        _EMPTY_TEMPLATE,
+        _compute_rmse,
+        _compute_snr,
+        _estimate_center,
+    )
+    from edge.recipes import FitLims
+
+    rng = np.random.default_rng(11)
+    nu = np.linspace(5.0, 15.0, 101)
+
+    for fit_lims in (None, FitLims(amp_min=0.1, amp_max=0.4)):
+        band = make_simple_band(
+            center=10.0, sigma=1.5, window_min=5.0, window_max=15.0
+        )
+        if fit_lims is not None:
+            band = make_simple_band(
+                center=10.0, sigma=1.5, window_min=5.0, window_max=15.0
+            )
+            object.__setattr__(band, "fit_lims", fit_lims)
+        intensity = (
+            np.exp(-0.5 * ((nu - 10.3) / 1.5) ** 2)
+            + 0.05 * rng.standard_normal(nu.size)
+        )
+
+        amp_min = float(fit_lims.amp_min) if fit_lims else 0.0
+        amp_max = float(fit_lims.amp_max) if fit_lims else 0.0
+        center_k, snr_k, rmse_k = _metrics_nb(
+            nu,
+            intensity,
+            band.center,
+            band.sigma,
+            SHAPE_GAUSSIAN,
+            0.5,
+            _EMPTY_TEMPLATE,
+            amp_min,
+            amp_max,
+            fit_lims is not None,
+            fit_lims is not None,
+        )
+
+        assert center_k == pytest.approx(_estimate_center(nu, intensity))
+        assert snr_k == pytest.approx(_compute_snr(intensity), rel=1e-9)
+        # rel 1e-6: the scalar template uses a float32 intermediate,
+        # the kernel computes in float64 throughout.
+        assert rmse_k == pytest.approx(_compute_rmse(nu, intensity, band), rel=1e-6)
+
+
+def _make_fft_eligible_recipe() -> RecipeConfig:
+    """
+    A recipe that triggers the FFT amplitude path in _compute_metrics_batch:
+    >= 16 Gaussian bands, every window >= 256 grid points on a uniform axis.
+    The first band sits near the grid edge (center within 4*sigma of nu[0]).
+    """
+    bands = [
+        make_simple_band(
+            name="Edge",
+            center=20.0,
+            tol=10.0,
+            sigma=12.0,
+            window_min=0.0,
+            window_max=140.0,
+            role="watch",
+        )
+    ]
+    for k in range(15):
+        c = 300.0 + 100.0 * k
+        bands.append(
+            make_simple_band(
+                name=f"B{k}",
+                center=c,
+                tol=10.0,
+                sigma=12.0,
+                window_min=c - 70.0,
+                window_max=c + 70.0,
+                role="watch",
+            )
+        )
+    return make_simple_recipe(bands=bands, epsilon=0.5, snr_min=1.0)
+
+
+def test_fft_amplitude_path_handles_edge_bands():
+    """
+    The FFT amplitude scan must not bias bands whose +-4 sigma kernel
+    support is clipped by the grid edge: their RMSE has to match the exact
+    per-band dot product (regression: edge bands used to get a garbage
+    amplitude and flip PEAK_OK to BAD_QUALITY).
+    """
+    from edge.qc_pipeline import (
+        _compute_metrics_batch,
+        _compute_rmse,
+        _extract_window,
+        _fft_amps_eligible,
+        _get_precomp,
+    )
+
+    recipe = _make_fft_eligible_recipe()
+    nu = np.linspace(0.0, 2000.0, 4001)  # 0.5 cm^-1 step, uniform
+    rng = np.random.default_rng(7)
+    intensity = 0.02 * rng.standard_normal(nu.size)
+    for b in recipe.bands:
+        intensity += np.exp(-0.5 * ((nu - b.center) / b.sigma) ** 2)
+
+    precomp = _get_precomp(recipe, nu)
+    assert _fft_amps_eligible(recipe, precomp, nu)
+
+    _, _, rmse, _ = _compute_metrics_batch(intensity, recipe, precomp, nu=nu)
+    for i, band in enumerate(recipe.bands):
+        w_nu, w_I = _extract_window(nu, intensity, band)
+        exact = _compute_rmse(w_nu, w_I, band)
+        # The interior bands go through the FFT approximation, the edge
+        # band through the exact fallback; both must track the scalar RMSE.
+        assert rmse[i] == pytest.approx(exact, abs=5e-3), band.name
\ No newline at end of file